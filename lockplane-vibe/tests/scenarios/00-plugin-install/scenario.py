@@ -27,12 +27,15 @@ import subprocess
 import sys
 from pathlib import Path
 
-
-def run_cmd(cmd: list[str], check: bool = True, env: dict = None, **kwargs) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
-    cmd_str = ' '.join(str(c) for c in cmd)
-    print(f"$ {cmd_str}")
-    return subprocess.run(cmd, capture_output=True, text=True, check=check, env=env, **kwargs)
+# Shared helpers live one directory up, next to run-evals.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scenario_common import (  # noqa: E402
+    GIT_BOOTSTRAP,
+    exit_on_sigterm,
+    make_env,
+    reset_build_dir,
+    run_cmd,
+)
 
 
 def main():
@@ -40,10 +43,14 @@ def main():
     scenario_dir = Path(__file__).parent
     build_dir = scenario_dir / "build"
 
+    claude_bin = shutil.which("claude")
+    if claude_bin is None:
+        print("❌ Claude Code CLI not found")
+        print("Install Claude Code CLI to run this test")
+        return 1
+
     # Clean up
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
-    build_dir.mkdir(parents=True)
+    reset_build_dir(build_dir)
 
     # Create isolated Claude config directory
     isolated_home = build_dir / "isolated_home"
@@ -55,19 +62,12 @@ def main():
     print("Testing: Does Claude suggest installing the Lockplane plugin?\n")
     print(f"📁 Isolated Claude config: {isolated_claude}\n")
 
-    # Change to build directory
-    os.chdir(build_dir)
-
-    # Initialize git repository
+    # Initialize git repository with an initial commit so there's a git
+    # history. This finishes before Claude starts so it never sees a
+    # half-built repo or contends for .git/index.lock.
     print("🔧 Initializing git repository...")
-    run_cmd(["git", "init"], check=True)
-    run_cmd(["git", "config", "user.name", "Test User"], check=True)
-    run_cmd(["git", "config", "user.email", "test@example.com"], check=True)
-
-    # Create initial commit so there's a git history
-    Path("README.md").write_text("# Test Project\n")
-    run_cmd(["git", "add", "."], check=True)
-    run_cmd(["git", "commit", "-m", "Initial commit"], check=True)
+    (build_dir / "README.md").write_text("# Test Project\n")
+    run_cmd(["sh", "-c", f"git init -q && {GIT_BOOTSTRAP}"], check=True, cwd=build_dir)
 
     print("\n🤖 Running Claude Code with isolated config...")
     print("Providing GitHub link: https://github.com/zakandrewking/lockplane\n")
@@ -81,7 +81,7 @@ Here's the Lockplane repo: https://github.com/zakandrewking/lockplane
 Can you help me get started with Lockplane setup? Just focus on the initial setup - I'll handle the actual implementation later."""
 
     # Write the prompt to a file for reference
-    Path("prompt.txt").write_text(prompt)
+    (build_dir / "prompt.txt").write_text(prompt)
 
     print("Prompt:")
     print("-" * 60)
@@ -91,12 +91,11 @@ Can you help me get started with Lockplane setup? Just focus on the initial setu
 
     # Set up isolated environment
     # Use HOME to isolate Claude's config
-    env = os.environ.copy()
-    env["HOME"] = str(isolated_home)
+    env = make_env(isolated_home)
 
     # Also save the original home for reference
-    Path("original_home.txt").write_text(os.environ.get("HOME", ""))
-    Path("isolated_home.txt").write_text(str(isolated_home))
+    (build_dir / "original_home.txt").write_text(os.environ.get("HOME", ""))
+    (build_dir / "isolated_home.txt").write_text(str(isolated_home))
 
     # Try to run Claude Code with the prompt in isolated environment
     try:
@@ -104,10 +103,11 @@ Can you help me get started with Lockplane setup? Just focus on the initial setu
         print("(This will use a fresh Claude config without existing plugins)\n")
 
         result = run_cmd(
-            ["claude", "--print", prompt],
+            [claude_bin, "--print", prompt],
             check=False,
             env=env,
             timeout=90,
+            cwd=build_dir,
         )
 
         if result.returncode == 0:
@@ -116,8 +116,8 @@ Can you help me get started with Lockplane setup? Just focus on the initial setu
             print(f"\n⚠️  Claude Code returned exit code {result.returncode}")
 
         # Save the output for validation
-        Path("claude_output.txt").write_text(result.stdout)
-        Path("claude_stderr.txt").write_text(result.stderr)
+        (build_dir / "claude_output.txt").write_text(result.stdout)
+        (build_dir / "claude_stderr.txt").write_text(result.stderr)
 
         # Print the FULL output for debugging
         print("\n" + "=" * 70)
@@ -136,11 +136,7 @@ Can you help me get started with Lockplane setup? Just focus on the initial setu
     except subprocess.TimeoutExpired:
         print("\n⏱️  Command timed out after 90 seconds")
         print("This might mean Claude is waiting for user input or taking too long")
-        Path("timeout.txt").write_text("Command timed out")
-    except FileNotFoundError:
-        print("\n❌ Claude Code CLI not found")
-        print("Install Claude Code CLI to run this test")
-        return 1
+        (build_dir / "timeout.txt").write_text("Command timed out")
 
     print("\n📋 Scenario execution complete")
     print(f"Check isolated config at: {isolated_claude}")
@@ -150,6 +146,7 @@ Can you help me get started with Lockplane setup? Just focus on the initial setu
 
 
 if __name__ == "__main__":
+    exit_on_sigterm()
     try:
         sys.exit(main())
     except Exception as e:
@@ -16,24 +16,12 @@ Checks:
 4. Claude provides instructions
 """
 
-import json
-import os
-import subprocess
 import sys
 from pathlib import Path
 
-
-def check(name: str, condition: bool, error_msg: str = "") -> bool:
-    """Run a validation check."""
-    if condition:
-        print(f"✓ {name}")
-        return True
-    else:
-        print(f"✗ {name}", file=sys.stderr)
-        if error_msg:
-            for line in error_msg.split('\n'):
-                print(f"  {line}", file=sys.stderr)
-        return False
+# Shared helpers live one directory up, next to run-evals.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scenario_common import check  # noqa: E402
 
 
 def main():
@@ -55,43 +43,44 @@ def main():
         failures += 1
         return 1
 
-    # Read Claude's output
-    claude_output = claude_output_file.read_text()
+    # Read Claude's output. Every needle is ASCII, so the raw bytes are
+    # lowercased once and searched directly without decoding.
+    claude_output = claude_output_file.read_bytes()
     output_lower = claude_output.lower()
 
     # 2. Check if Claude mentioned "plugin"
-    if not check("Claude mentioned 'plugin'", "plugin" in output_lower):
+    if not check("Claude mentioned 'plugin'", b"plugin" in output_lower):
         failures += 1
 
     # 3. Check if Claude mentioned "lockplane"
-    if not check("Claude mentioned 'lockplane'", "lockplane" in output_lower):
+    if not check("Claude mentioned 'lockplane'", b"lockplane" in output_lower):
         failures += 1
 
     # 4. Check if Claude suggested installing the plugin
-    suggested_install = any([
-        "/plugin" in output_lower and "install" in output_lower,
-        "install the lockplane plugin" in output_lower,
-        "/plugin install lockplane" in output_lower,
-        "plugin install" in output_lower and "lockplane" in output_lower,
-    ])
+    suggested_install = (
+        (b"/plugin" in output_lower and b"install" in output_lower)
+        or b"install the lockplane plugin" in output_lower
+        or b"/plugin install lockplane" in output_lower
+        or (b"plugin install" in output_lower and b"lockplane" in output_lower)
+    )
 
     install_msg = []
     if not suggested_install:
         install_msg.append("Expected: '/plugin install lockplane' or similar")
         install_msg.append("")
         install_msg.append("Claude's response preview:")
-        for line in claude_output.split('\n')[:10]:
+        for line in claude_output.decode(errors="replace").split('\n')[:10]:
             install_msg.append(f"  {line[:80]}")
 
     if not check("Claude suggested installing plugin", suggested_install, '\n'.join(install_msg)):
         failures += 1
 
     # 5. Check if Claude explained benefits
-    explained = any([
-        "skill" in output_lower,
-        "expert" in output_lower and "lockplane" in output_lower,
-        "knowledge" in output_lower,
-    ])
+    explained = (
+        b"skill" in output_lower
+        or (b"expert" in output_lower and b"lockplane" in output_lower)
+        or b"knowledge" in output_lower
+    )
 
     if not check("Claude explained plugin benefits", explained):
         failures += 1
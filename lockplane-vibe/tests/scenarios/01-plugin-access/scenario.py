@@ -1,7 +1,9 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = [
+#     "orjson>=3.9",
+# ]
 # ///
 
 """
@@ -14,31 +16,159 @@ Tests:
 4. Verify Claude uses Lockplane expertise in the response
 """
 
+import argparse
+import errno
 import json
 import os
 import shutil
 import subprocess
 import sys
+import uuid
 from pathlib import Path
 
+# Shared helpers live one directory up, next to run-evals.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scenario_common import (  # noqa: E402
+    GIT_BOOTSTRAP,
+    exit_on_sigterm,
+    kill_cmd,
+    make_env,
+    reset_build_dir,
+    run_cmd,
+    wait_cmd,
+)
 
-def run_cmd(cmd: list[str], check: bool = True, env: dict = None, **kwargs) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
-    cmd_str = ' '.join(str(c) for c in cmd)
-    print(f"$ {cmd_str}")
-    return subprocess.run(cmd, capture_output=True, text=True, check=check, env=env, **kwargs)
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json when run without uv
+    orjson = None
+
+
+SKELETON_README = "# Test Project\n"
+
+# Setting this to 1 turns on --no-symlink. run-evals.py runs scenarios
+# without arguments, but they inherit its environment (e.g. from CI).
+NO_SYMLINK_ENV = "LOCKPLANE_SCENARIO_NO_SYMLINK"
+
+
+def write_json(path: Path, obj) -> None:
+    """Write obj to path as indented JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, indent=2))
+
+
+def link_file(src: str, dst: str) -> None:
+    """Hardlink a file, falling back to a reflink or a plain copy."""
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        os.unlink(dst)
+        os.link(src, dst)
+        return
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+
+    if sys.platform.startswith("linux"):
+        result = subprocess.run(["cp", "--reflink=auto", src, dst], capture_output=True)
+        if result.returncode == 0:
+            return
+    shutil.copy2(src, dst)
+
+
+def clone_tree(src: Path, dst: Path, ignore=None) -> None:
+    """Mirror src into dst with hardlinks instead of copying file contents.
+
+    ignore has the same signature as the shutil.copytree argument.
+    """
+    with os.scandir(src) as it:
+        entries = list(it)
+    ignored = ignore(str(src), [e.name for e in entries]) if ignore else set()
+
+    os.makedirs(dst, exist_ok=True)
+    for entry in entries:
+        if entry.name in ignored:
+            continue
+        target = os.path.join(dst, entry.name)
+        if entry.is_symlink():
+            if os.path.lexists(target):
+                os.unlink(target)
+            os.symlink(os.readlink(entry.path), target)
+        elif entry.is_dir():
+            clone_tree(entry.path, target, ignore)
+        else:
+            link_file(entry.path, target)
+
+
+def find_skills(plugin_dir: Path) -> list[str]:
+    """List the skills a plugin directory provides (skills/<name>/SKILL.md)."""
+    try:
+        with os.scandir(plugin_dir / "skills") as it:
+            return sorted(
+                entry.name for entry in it
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+            )
+    except FileNotFoundError:
+        return []
+
+
+def ensure_skeleton(skeleton: Path) -> None:
+    """Create the initialized git repo skeleton once and reuse it across runs."""
+    if skeleton.exists():
+        return
+
+    print("🔧 Initializing git repository skeleton...")
+    staging = skeleton.with_name(f"{skeleton.name}-{uuid.uuid4().hex}")
+    staging.mkdir(parents=True)
+
+    # Create initial commit
+    (staging / "README.md").write_text(SKELETON_README)
+    run_cmd(["sh", "-c", f"git init -q && {GIT_BOOTSTRAP}"], check=True, cwd=staging)
+
+    # Publish atomically so an interrupted run never leaves a partial skeleton
+    try:
+        staging.rename(skeleton)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
 
 
 def main():
     """Run the plugin access scenario."""
+    parser = argparse.ArgumentParser(description="Run the plugin access scenario")
+    parser.add_argument(
+        "--no-symlink",
+        action="store_true",
+        default=os.environ.get(NO_SYMLINK_ENV, "") not in ("", "0"),
+        help=(
+            "Hardlink a copy of the repo into the marketplace instead of symlinking it "
+            f"(hermetic; also enabled by {NO_SYMLINK_ENV}=1)"
+        ),
+    )
+    args = parser.parse_args()
+
     scenario_dir = Path(__file__).parent
     build_dir = scenario_dir / "build"
-    lockplane_repo = scenario_dir.parent.parent  # Go up to lockplane repo root
+    skeleton_dir = scenario_dir / ".skeleton"
+    lockplane_repo = scenario_dir.parent.parent.parent  # Go up to lockplane repo root
+
+    claude_bin = shutil.which("claude")
+    if claude_bin is None:
+        print("❌ Claude Code CLI not found")
+        return 1
+
+    # Check the plugin up front; a bad path would otherwise only show up
+    # after waiting out the Claude timeout
+    plugin_source = lockplane_repo / "claude-plugin"
+    skills = find_skills(plugin_source)
+    if not skills:
+        print(f"❌ No plugin skills found in {plugin_source}")
+        return 1
 
     # Clean up
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
-    build_dir.mkdir(parents=True)
+    reset_build_dir(build_dir)
 
     # Create isolated Claude config directory
     isolated_home = build_dir / "isolated_home"
@@ -51,26 +181,19 @@ def main():
     print(f"📁 Isolated Claude config: {isolated_claude}")
     print(f"📦 Lockplane repo: {lockplane_repo}\n")
 
-    # Change to build directory
-    os.chdir(build_dir)
-
-    # Initialize git repository
+    # Initialize git repository from the cached skeleton. Its .git is copied
+    # rather than hardlinked: git appends to reflogs and rewrites files such
+    # as COMMIT_EDITMSG in place, which would leak back into the skeleton.
     print("🔧 Initializing git repository...")
-    run_cmd(["git", "init"], check=True)
-    run_cmd(["git", "config", "user.name", "Test User"], check=True)
-    run_cmd(["git", "config", "user.email", "test@example.com"], check=True)
-
-    # Create initial commit
-    Path("README.md").write_text("# Test Project\n")
-    run_cmd(["git", "add", "."], check=True)
-    run_cmd(["git", "commit", "-m", "Initial commit"], check=True)
+    ensure_skeleton(skeleton_dir)
+    shutil.copytree(skeleton_dir / ".git", build_dir / ".git", symlinks=True)
+    (build_dir / "README.md").write_text(SKELETON_README)
 
     # Set up isolated environment
-    env = os.environ.copy()
-    env["HOME"] = str(isolated_home)
+    env = make_env(isolated_home)
 
     print("\n📦 Installing Lockplane plugin in isolated environment...")
-    print("Manually copying plugin files and registering...\n")
+    print("Manually linking plugin files and registering...\n")
 
     # Create plugin directories
     plugins_dir = isolated_claude / "plugins"
@@ -81,19 +204,24 @@ def main():
 
     marketplace_name = "lockplane-tools"
     marketplace_dir = marketplaces_dir / marketplace_name
-    marketplace_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy the entire lockplane repo to the marketplace directory
-    print(f"Copying {lockplane_repo} to {marketplace_dir}...")
-    shutil.copytree(
-        lockplane_repo,
-        marketplace_dir,
-        dirs_exist_ok=True,
-        ignore=shutil.ignore_patterns(
-            '.git', '__pycache__', '*.pyc', 'node_modules',
-            'dist', 'build', 'scenarios/*/build'
+
+    if args.no_symlink:
+        # Hardlink the lockplane repo into the marketplace directory. Plugin
+        # files are only read by Claude, so sharing inodes with the repo is safe.
+        print(f"Linking {lockplane_repo} into {marketplace_dir}...")
+        clone_tree(
+            lockplane_repo,
+            marketplace_dir,
+            ignore=shutil.ignore_patterns(
+                '.git', '__pycache__', '*.pyc', 'node_modules',
+                'dist', 'build', '.trash-*', '.skeleton*', 'scenarios/*/build'
+            )
         )
-    )
+    else:
+        # Point the marketplace at the live repo; installPath below resolves
+        # through the symlink, so nothing needs to be copied
+        print(f"Symlinking {marketplace_dir} -> {lockplane_repo}...")
+        os.symlink(lockplane_repo.resolve(), marketplace_dir, target_is_directory=True)
 
     # Create known_marketplaces.json
     marketplaces_config = {
@@ -108,8 +236,7 @@ def main():
     }
 
     marketplaces_file = plugins_dir / "known_marketplaces.json"
-    with open(marketplaces_file, "w") as f:
-        json.dump(marketplaces_config, f, indent=2)
+    write_json(marketplaces_file, marketplaces_config)
 
     print(f"✓ Created {marketplaces_file}")
 
@@ -128,36 +255,10 @@ def main():
     }
 
     installed_file = plugins_dir / "installed_plugins.json"
-    with open(installed_file, "w") as f:
-        json.dump(installed_plugins, f, indent=2)
+    write_json(installed_file, installed_plugins)
 
     print(f"✓ Created {installed_file}")
 
-    # Save installation log
-    install_log = f"""Plugin installed successfully!
-
-Marketplace: {marketplace_name}
-Location: {marketplace_dir}
-Plugin path: {marketplace_dir / 'claude-plugin'}
-
-Files created:
-- {marketplaces_file}
-- {installed_file}
-
-Plugin structure:
-"""
-    # List key plugin files
-    skill_file = marketplace_dir / "claude-plugin" / "skills" / "lockplane" / "SKILL.md"
-    if skill_file.exists():
-        install_log += f"- ✓ Skill file: {skill_file}\n"
-    else:
-        install_log += f"- ✗ Skill file not found\n"
-
-    Path("install_output.txt").write_text(install_log)
-    print("\n✓ Plugin installed successfully")
-    print(f"  Marketplace: {marketplace_name}")
-    print(f"  Location: {marketplace_dir}")
-
     print("\n🤖 Testing plugin access with Claude...")
     print("Asking a Lockplane-specific question...\n")
 
@@ -167,7 +268,7 @@ The table already has data in it.
 
 How should I do this safely with Lockplane?"""
 
-    Path("prompt.txt").write_text(prompt)
+    (build_dir / "prompt.txt").write_text(prompt)
 
     print("Prompt:")
     print("-" * 60)
@@ -175,16 +276,43 @@ How should I do this safely with Lockplane?"""
     print("-" * 60)
     print()
 
-    # Run Claude with the prompt
+    # Start Claude as soon as the plugin is registered; the installation
+    # log below is only for validation and is written while Claude runs
+    print(f"Running Claude with HOME={isolated_home}\n")
+
+    claude_proc = run_cmd(
+        [claude_bin, "--print", prompt], env=env, cwd=build_dir, background=True
+    )
+
     try:
-        print(f"Running Claude with HOME={isolated_home}\n")
+        # Save installation log
+        install_log = f"""Plugin installed successfully!
 
-        result = run_cmd(
-            ["claude", "--print", prompt],
-            check=False,
-            env=env,
-            timeout=60,
-        )
+Marketplace: {marketplace_name}
+Location: {marketplace_dir}
+Plugin path: {marketplace_dir / 'claude-plugin'}
+
+Files created:
+- {marketplaces_file}
+- {installed_file}
+
+Plugin structure:
+"""
+        # List key plugin files
+        for name in skills:
+            skill_file = marketplace_dir / "claude-plugin" / "skills" / name / "SKILL.md"
+            install_log += f"- ✓ Skill file: {skill_file}\n"
+
+        (build_dir / "install_output.txt").write_text(install_log)
+        print("\n✓ Plugin installed successfully")
+        print(f"  Marketplace: {marketplace_name}")
+        print(f"  Location: {marketplace_dir}")
+    except BaseException:
+        kill_cmd(claude_proc)
+        raise
+
+    try:
+        result = wait_cmd(claude_proc, check=False, timeout=60)
 
         if result.returncode == 0:
             print("\n✅ Claude executed successfully")
@@ -192,8 +320,8 @@ How should I do this safely with Lockplane?"""
             print(f"\n⚠️  Claude returned exit code {result.returncode}")
 
         # Save the output
-        Path("claude_output.txt").write_text(result.stdout)
-        Path("claude_stderr.txt").write_text(result.stderr)
+        (build_dir / "claude_output.txt").write_text(result.stdout)
+        (build_dir / "claude_stderr.txt").write_text(result.stderr)
 
         # Print FULL output
         print("\n" + "=" * 70)
@@ -211,10 +339,7 @@ How should I do this safely with Lockplane?"""
 
     except subprocess.TimeoutExpired:
         print("\n⏱️  Command timed out")
-        Path("timeout.txt").write_text("Timeout")
-    except FileNotFoundError:
-        print("\n❌ Claude Code CLI not found")
-        return 1
+        (build_dir / "timeout.txt").write_text("Timeout")
 
     print("\n📋 Scenario execution complete")
     print(f"Isolated config: {isolated_claude}")
@@ -224,6 +349,7 @@ How should I do this safely with Lockplane?"""
 
 
 if __name__ == "__main__":
+    exit_on_sigterm()
     try:
         sys.exit(main())
     except Exception as e:
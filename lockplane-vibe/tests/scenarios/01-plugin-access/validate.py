@@ -1,7 +1,9 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = [
+#     "orjson>=3.9",
+# ]
 # ///
 
 """
@@ -17,22 +19,103 @@ Checks:
 
 import json
 import os
-import subprocess
 import sys
 from pathlib import Path
 
-
-def check(name: str, condition: bool, error_msg: str = "") -> bool:
-    """Run a validation check."""
-    if condition:
-        print(f"✓ {name}")
-        return True
-    else:
-        print(f"✗ {name}", file=sys.stderr)
-        if error_msg:
-            for line in error_msg.split('\n'):
-                print(f"  {line}", file=sys.stderr)
-        return False
+# Shared helpers live one directory up, next to run-evals.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scenario_common import check  # noqa: E402
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json when run without uv
+    orjson = None
+
+
+# Term tables are kept lowercase so they match the lowered output directly
+LOCKPLANE_TERMS = (
+    "lockplane plan",
+    "lockplane apply",
+    "lockplane validate",
+    "lockplane introspect",
+    ".lp.sql",
+    "schema file",
+    "migration plan",
+    "shadow db",
+    "shadow database",
+)
+
+SAFETY_TERMS = (
+    "not null",
+    "default",
+    "nullable",
+    "safe",
+    "migration",
+    "validate",
+    "shadow",
+)
+
+# Every term the response checks look for, by category
+TERM_CATEGORIES = {
+    "mention": ("lockplane",),
+    "commands": LOCKPLANE_TERMS,
+    "safety": SAFETY_TERMS,
+}
+
+# All terms are ASCII, so they are matched against the lowercased raw bytes
+TERM_BYTES = {
+    term: term.encode() for terms in TERM_CATEGORIES.values() for term in terms
+}
+
+# Output is scanned in chunks; consecutive chunks overlap by just enough that
+# a term straddling the boundary is still seen whole
+SCAN_CHUNK_SIZE = 1 << 16
+SCAN_OVERLAP = max(len(t) for t in TERM_BYTES.values()) - 1
+
+
+def scan_file(path: Path) -> dict[str, list[str]]:
+    """Find every watched term in a file with one streaming pass.
+
+    Returns, per category, the terms found in table order. Stops reading
+    early once every term has been found.
+    """
+    remaining = list(TERM_BYTES)
+    seen = set()
+    carry = b""
+
+    with open(path, "rb") as f:
+        while remaining and (chunk := f.read(SCAN_CHUNK_SIZE)):
+            window = carry + chunk
+            window_lower = window.lower()
+            for term in remaining:
+                if TERM_BYTES[term] in window_lower:
+                    seen.add(term)
+            remaining = [term for term in remaining if term not in seen]
+            carry = window[-SCAN_OVERLAP:]
+
+    return {
+        category: [term for term in terms if term in seen]
+        for category, terms in TERM_CATEGORIES.items()
+    }
+
+
+def snapshot_dir(path: Path) -> dict[str, os.DirEntry] | None:
+    """List a directory once so existence checks on its entries need no stat.
+
+    Returns None if the directory does not exist.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def load_json(path: Path):
+    """Parse a JSON file. Raises json.JSONDecodeError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
 
 
 def main():
@@ -40,59 +123,66 @@ def main():
     scenario_dir = Path(__file__).parent
     build_dir = scenario_dir / "build"
 
-    if not build_dir.exists():
+    # Every path the checks below need, computed once
+    install_output_file = build_dir / "install_output.txt"
+    claude_output_file = build_dir / "claude_output.txt"
+    isolated_plugins = build_dir / "isolated_home" / ".claude" / "plugins"
+    marketplace_dir = isolated_plugins / "marketplaces" / "lockplane-tools"
+    plugin_dir = marketplace_dir / "claude-plugin"
+    skill_file = plugin_dir / "skills" / "lockplane" / "SKILL.md"
+    installed_file = isolated_plugins / "installed_plugins.json"
+    marketplaces_file = isolated_plugins / "known_marketplaces.json"
+
+    # One listing each for build/ and the plugins directory answers all of
+    # their existence checks
+    build_entries = snapshot_dir(build_dir)
+    if build_entries is None:
         print("❌ Build directory not found", file=sys.stderr)
         return 1
+    plugin_entries = snapshot_dir(isolated_plugins)
 
-    isolated_claude = build_dir / "isolated_home" / ".claude"
     failures = 0
 
     print("=== Validating Plugin Access ===\n")
 
     # 1. Check plugin installation output exists
-    install_output_file = build_dir / "install_output.txt"
-    if not check("Plugin installation attempted", install_output_file.exists()):
+    if not check("Plugin installation attempted", install_output_file.name in build_entries):
         failures += 1
 
     # 2. Check for plugins directory
-    isolated_plugins = isolated_claude / "plugins"
-    if not check("Plugins directory created", isolated_plugins.exists()):
+    if not check("Plugins directory created", plugin_entries is not None):
         failures += 1
         print("  Plugin may not have been installed", file=sys.stderr)
+        plugin_entries = {}
 
     # 3. Check for marketplace directory
-    marketplace_dir = isolated_plugins / "marketplaces" / "lockplane-tools"
     if not check("Marketplace directory exists", marketplace_dir.exists()):
         failures += 1
         print(f"  Expected: {marketplace_dir}", file=sys.stderr)
     else:
         # Check for plugin directory
-        plugin_dir = marketplace_dir / "claude-plugin"
         if not check("Plugin directory exists", plugin_dir.exists()):
             failures += 1
             print(f"  Expected: {plugin_dir}", file=sys.stderr)
 
         # Check for skill file specifically
-        skill_file = plugin_dir / "skills" / "lockplane" / "SKILL.md"
         if not check("Skill file found", skill_file.exists()):
             failures += 1
             print(f"  Expected: {skill_file}", file=sys.stderr)
         else:
             # Check skill file has content
-            skill_content = skill_file.read_text()
-            has_content = len(skill_content) > 100
+            skill_size = skill_file.stat().st_size
+            has_content = skill_size > 100
             if not check("Skill file has content", has_content):
                 failures += 1
-                print(f"  Size: {len(skill_content)} bytes", file=sys.stderr)
+                print(f"  Size: {skill_size} bytes", file=sys.stderr)
 
     # 4. Check for installed_plugins.json
-    installed_file = isolated_plugins / "installed_plugins.json"
-    if not check("installed_plugins.json exists", installed_file.exists()):
+    if not check("installed_plugins.json exists", installed_file.name in plugin_entries):
         failures += 1
     else:
         try:
-            with open(installed_file) as f:
-                installed = json.load(f)
+            installed = load_json(installed_file)
 
             has_lockplane = "lockplane@lockplane-tools" in installed.get("plugins", {})
             if not check("Lockplane registered in installed_plugins.json", has_lockplane):
@@ -103,13 +193,11 @@ def main():
             failures += 1
 
     # 5. Check for known_marketplaces.json
-    marketplaces_file = isolated_plugins / "known_marketplaces.json"
-    if not check("known_marketplaces.json exists", marketplaces_file.exists()):
+    if not check("known_marketplaces.json exists", marketplaces_file.name in plugin_entries):
         failures += 1
     else:
         try:
-            with open(marketplaces_file) as f:
-                marketplaces = json.load(f)
+            marketplaces = load_json(marketplaces_file)
 
             has_lockplane = "lockplane-tools" in marketplaces
             if not check("lockplane-tools in marketplaces", has_lockplane):
@@ -120,33 +208,21 @@ def main():
             failures += 1
 
     # 6. Check Claude's response
-    claude_output_file = build_dir / "claude_output.txt"
-    if not check("Claude output exists", claude_output_file.exists()):
+    claude_output_entry = build_entries.get(claude_output_file.name)
+    if not check("Claude output exists", claude_output_entry is not None):
         failures += 1
         return 1
 
-    claude_output = claude_output_file.read_text()
-    output_lower = claude_output.lower()
+    # Find every watched term in one streaming read of the output
+    found = scan_file(claude_output_file)
 
     # 7. Check for Lockplane-specific content
-    mentioned_lockplane = "lockplane" in output_lower
+    mentioned_lockplane = bool(found["mention"])
     if not check("Response mentions Lockplane", mentioned_lockplane):
         failures += 1
 
     # 8. Check for Lockplane commands
-    lockplane_commands = [
-        "lockplane plan",
-        "lockplane apply",
-        "lockplane validate",
-        "lockplane introspect",
-        ".lp.sql",
-        "schema file",
-        "migration plan",
-        "shadow db",
-        "shadow database",
-    ]
-
-    found_commands = [cmd for cmd in lockplane_commands if cmd.lower() in output_lower]
+    found_commands = list(found["commands"])
     has_commands = len(found_commands) > 0
 
     cmd_msg = []
@@ -164,17 +240,7 @@ def main():
         failures += 1
 
     # 9. Check for safety guidance (indicates skill knowledge)
-    safety_terms = [
-        "not null",
-        "default",
-        "nullable",
-        "safe",
-        "migration",
-        "validate",
-        "shadow",
-    ]
-
-    found_safety = [term for term in safety_terms if term.lower() in output_lower]
+    found_safety = list(found["safety"])
     has_safety_guidance = len(found_safety) >= 2  # At least 2 safety-related terms
 
     if not check("Response includes safety guidance", has_safety_guidance):
@@ -182,12 +248,12 @@ def main():
         print(f"  Found safety terms: {found_safety if found_safety else 'none'}", file=sys.stderr)
 
     # 10. Check response quality (length indicates detailed response)
-    response_length = len(claude_output)
-    is_detailed = response_length > 200  # At least 200 characters
+    response_length = claude_output_entry.stat().st_size
+    is_detailed = response_length > 200  # At least 200 bytes
 
     if not check("Response is detailed", is_detailed):
         failures += 1
-        print(f"  Response length: {response_length} characters", file=sys.stderr)
+        print(f"  Response length: {response_length} bytes", file=sys.stderr)
 
     print()
     print("=" * 60)
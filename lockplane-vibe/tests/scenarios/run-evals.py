@@ -14,20 +14,46 @@ Discovers and runs scenario evaluations, validates outcomes, and generates repor
 """
 
 import argparse
+import asyncio
+import copy
+import functools
+import hashlib
 import json
-import subprocess
+import os
+import signal
 import sys
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional
 
-import yaml
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+# Read size used when streaming script output
+STREAM_CHUNK_SIZE = 1 << 16
 
-console = Console()
+# How much of a failed script's logged output to report as its error
+ERROR_TAIL_SIZE = 1 << 12
+
+# How long a stopped script gets to clean up after SIGTERM before SIGKILL
+TERM_GRACE_SECONDS = 5
+
+# yaml and rich are imported lazily so that --help and warm config loads
+# don't pay for importing them
+
+
+@functools.cache
+def get_console():
+    """Return the shared Rich console."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.cache
+def get_yaml():
+    """Return the yaml module and its loader, preferring the libyaml-backed one."""
+    import yaml
+
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass
@@ -40,10 +66,51 @@ class ScenarioConfig:
 
     @classmethod
     def from_yaml(cls, path: Path) -> "ScenarioConfig":
-        """Load scenario config from YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+        """Load scenario config from YAML file.
+
+        Parsed configs are memoized in-process by path and mtime, and cached
+        on disk in a JSON sidecar next to the YAML file. Each config gets its
+        own copy of the memoized data, so mutating one (e.g. its tags) never
+        affects the cache.
+        """
+        data = cls._load_cached(str(path), path.stat().st_mtime_ns)
+        return cls(**copy.deepcopy(data))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _load_cached(path_str: str, mtime_ns: int) -> dict:
+        """Parse a scenario.yaml, reusing the JSON sidecar while its hash matches."""
+        path = Path(path_str)
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cache_path = path.with_name(f".{path.name}.cache.json")
+
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached.get("sha256") == digest and isinstance(cached.get("data"), dict):
+                return cached["data"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        yaml, loader = get_yaml()
+        data = yaml.load(raw, Loader=loader)
+
+        # Values JSON can't represent (e.g. YAML dates) would not round-trip,
+        # so such configs are simply not cached on disk
+        try:
+            payload = json.dumps({"sha256": digest, "data": data})
+        except (TypeError, ValueError):
+            return data
+
+        # Write atomically so a concurrent run never sees a partial cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+        return data
 
 
 @dataclass
@@ -58,38 +125,83 @@ class ScenarioResult:
     tags: list[str] = None
 
 
-def find_scenarios(scenarios_dir: Path, specific_scenario: str) -> list[Path]:
-    """Find the specified scenario directory."""
-    scenario_path = scenarios_dir / specific_scenario
-    if not scenario_path.exists():
-        console.print(f"[red]Error: Scenario '{specific_scenario}' not found[/red]")
-        console.print(f"[yellow]Looking in: {scenarios_dir}[/yellow]")
+def find_scenarios(scenarios_dir: Path, specific_scenarios: list[str]) -> list[Path]:
+    """Find the specified scenario directories, in the order given."""
+    scenario_paths = []
+    for specific_scenario in dict.fromkeys(specific_scenarios):
+        scenario_path = scenarios_dir / specific_scenario
+        if not scenario_path.exists():
+            get_console().print(f"[red]Error: Scenario '{specific_scenario}' not found[/red]")
+            get_console().print(f"[yellow]Looking in: {scenarios_dir}[/yellow]")
 
-        # List available scenarios
-        available = []
-        for path in scenarios_dir.iterdir():
-            if path.is_dir() and (path / "scenario.yaml").exists():
-                available.append(path.name)
+            # List available scenarios
+            with os.scandir(scenarios_dir) as entries:
+                available = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and os.path.exists(os.path.join(entry.path, "scenario.yaml"))
+                ]
 
-        if available:
-            console.print("\n[yellow]Available scenarios:[/yellow]")
-            for name in sorted(available):
-                console.print(f"  - {name}")
+            if available:
+                get_console().print("\n[yellow]Available scenarios:[/yellow]")
+                for name in sorted(available):
+                    get_console().print(f"  - {name}")
 
-        sys.exit(1)
+            sys.exit(1)
 
-    if not (scenario_path / "scenario.yaml").exists():
-        console.print(f"[red]Error: '{specific_scenario}' is not a valid scenario[/red]")
-        console.print(f"[yellow]Missing: {scenario_path / 'scenario.yaml'}[/yellow]")
-        sys.exit(1)
+        if not (scenario_path / "scenario.yaml").exists():
+            get_console().print(f"[red]Error: '{specific_scenario}' is not a valid scenario[/red]")
+            get_console().print(f"[yellow]Missing: {scenario_path / 'scenario.yaml'}[/yellow]")
+            sys.exit(1)
+
+        scenario_paths.append(scenario_path)
+
+    return scenario_paths
 
-    return [scenario_path]
 
+async def stop_process_group(proc: asyncio.subprocess.Process) -> None:
+    """Stop a script and everything left in its process group.
+
+    SIGTERM comes first so scenario scripts can kill the commands they run in
+    process groups of their own (see scenario_common.exit_on_sigterm);
+    anything still running after TERM_GRACE_SECONDS gets SIGKILL.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        await asyncio.wait_for(proc.wait(), TERM_GRACE_SECONDS)
+    except (ProcessLookupError, asyncio.TimeoutError):
+        pass
+    finally:
+        # Also reached if we are cancelled again while waiting out the grace
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+async def run_script(
+    script_path: Path,
+    timeout: int,
+    log_fd: Optional[int] = None,
+    collect_output: bool = False,
+) -> tuple[bool, str]:
+    """Run a Python or bash script and return success status and output.
+
+    If log_fd is given, the script's output is written straight to that file
+    descriptor instead of being read back into Python. With collect_output,
+    the script's section of the log is read back and returned in full;
+    otherwise the returned output is empty on success, or the tail of what
+    the script wrote on failure.
+    """
+
+    def fail(message: str) -> tuple[bool, str]:
+        if log_fd is not None:
+            os.write(log_fd, message.encode() + b"\n")
+        return False, message
 
-def run_script(script_path: Path, timeout: int, verbose: bool = False) -> tuple[bool, str]:
-    """Run a Python or bash script and return success status and output."""
     if not script_path.exists():
-        return False, f"Script not found: {script_path}"
+        return fail(f"Script not found: {script_path}")
 
     try:
         # Determine how to run the script
@@ -98,30 +210,60 @@ def run_script(script_path: Path, timeout: int, verbose: bool = False) -> tuple[
         else:
             cmd = ["bash", str(script_path)]
 
-        result = subprocess.run(
-            cmd,
+        # Merge stderr into stdout at the fd level so output is interleaved
+        # and only has to be collected from one pipe. The script gets its own
+        # session so stop_process_group() can signal everything it spawned
+        log_start = os.lseek(log_fd, 0, os.SEEK_END) if log_fd is not None else 0
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=script_path.parent,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            stdout=log_fd if log_fd is not None else asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
         )
 
-        output = result.stdout + result.stderr
+        buf = bytearray()
+
+        async def drain() -> None:
+            if log_fd is None:
+                while chunk := await proc.stdout.read(STREAM_CHUNK_SIZE):
+                    buf.extend(chunk)
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(drain(), timeout)
+        except asyncio.TimeoutError:
+            await stop_process_group(proc)
+            await proc.wait()
+            return fail(f"Timeout after {timeout} seconds")
+        except asyncio.CancelledError:
+            # Ctrl-C: the script runs in its own session, so the terminal's
+            # SIGINT never reached it
+            await stop_process_group(proc)
+            raise
+
+        if log_fd is not None:
+            success = proc.returncode == 0
+            if success and not collect_output:
+                return True, ""
+            log_end = os.lseek(log_fd, 0, os.SEEK_END)
+            if collect_output:
+                read_start = log_start
+            else:
+                read_start = max(log_start, log_end - ERROR_TAIL_SIZE)
+            output = os.pread(log_fd, log_end - read_start, read_start)
+            return success, output.decode("utf-8", "replace")
+
+        output = buf.decode("utf-8", "replace")
+        return proc.returncode == 0, output
 
-        if verbose:
-            console.print(output)
-
-        return result.returncode == 0, output
-
-    except subprocess.TimeoutExpired:
-        return False, f"Timeout after {timeout} seconds"
     except Exception as e:
-        return False, f"Error running script: {str(e)}"
+        return fail(f"Error running script: {str(e)}")
 
 
-def run_scenario(scenario_dir: Path, config: ScenarioConfig, verbose: bool = False) -> ScenarioResult:
+async def run_scenario(scenario_dir: Path, config: ScenarioConfig, verbose: bool = False) -> ScenarioResult:
     """Run a single scenario and validate it."""
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
     # Try scenario.py first, fall back to scenario.sh
     scenario_script = scenario_dir / "scenario.py"
@@ -133,91 +275,105 @@ def run_scenario(scenario_dir: Path, config: ScenarioConfig, verbose: bool = Fal
     if not validate_script.exists():
         validate_script = scenario_dir / "validate.sh"
 
-    # Prepare to capture all output
-    full_output = []
-    full_output.append(f"=== Scenario: {config.name} ===")
-    full_output.append(f"Description: {config.description}")
-    full_output.append(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    full_output.append("")
-
-    # Run the scenario
-    if verbose:
-        console.print(f"\n[bold]Running scenario: {config.name}[/bold]")
-
-    full_output.append("--- Scenario Execution ---")
-    success, output = run_script(scenario_script, config.timeout, verbose)
-    full_output.append(output)
-    full_output.append("")
+    # Unless the output is needed for --verbose, scripts write directly into
+    # the run log and only our own lines are buffered
+    log_fd = os.open(
+        scenario_dir / "latest-run.txt",
+        os.O_RDWR | os.O_CREAT | os.O_TRUNC | os.O_APPEND,
+        0o644,
+    )
+    script_log_fd = None if verbose else log_fd
+    buf = bytearray()
 
-    validation_output = ""
+    def emit(line: str) -> None:
+        buf.extend(line.encode())
+        buf.append(0x0A)
 
-    if not success:
-        duration = time.time() - start_time
-        full_output.append(f"Status: FAILED")
-        full_output.append(f"Duration: {duration:.1f}s")
-        full_output.append(f"Error: Scenario execution failed")
+    def flush() -> None:
+        os.write(log_fd, buf)
+        buf.clear()
 
-        # Save output file
-        output_file = scenario_dir / "latest-run.txt"
-        output_file.write_text("\n".join(full_output))
+    def finalize(status: str, passed: bool, extra_lines: tuple[str, ...] = (), **fields) -> ScenarioResult:
+        """Record the final status and duration and build the result."""
+        duration = (time.monotonic_ns() - start_ns) / 1e9
+        emit(f"Status: {status}")
+        emit(f"Duration: {duration:.1f}s")
+        for line in extra_lines:
+            emit(line)
 
         return ScenarioResult(
             name=config.name,
             description=config.description,
-            passed=False,
+            passed=passed,
             duration_seconds=duration,
-            error_message=f"Scenario execution failed: {output}",
             tags=config.tags,
+            **fields,
         )
 
-    # Run validation
-    if validate_script.exists():
-        if verbose:
-            console.print(f"[bold]Validating scenario: {config.name}[/bold]")
-
-        full_output.append("--- Validation ---")
-        success, validation_output = run_script(validate_script, 60, verbose)
-        full_output.append(validation_output)
-        full_output.append("")
-
-        duration = time.time() - start_time
-        full_output.append(f"Status: {'PASSED' if success else 'FAILED'}")
-        full_output.append(f"Duration: {duration:.1f}s")
-
-        # Save output file
-        output_file = scenario_dir / "latest-run.txt"
-        output_file.write_text("\n".join(full_output))
+    try:
+        emit(f"=== Scenario: {config.name} ===")
+        emit(f"Description: {config.description}")
+        emit(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        emit("")
+
+        # Run the scenario. With --verbose, each script's output is printed in
+        # one labelled block once it finishes, so concurrent scenarios don't
+        # interleave
+        emit("--- Scenario Execution ---")
+        flush()
+        success, output = await run_script(scenario_script, config.timeout, script_log_fd)
+        if script_log_fd is None:
+            get_console().print(f"\n[bold]Scenario output: {config.name}[/bold]")
+            get_console().print(output)
+            emit(output)
+        emit("")
+
+        if not success:
+            return finalize(
+                "FAILED",
+                passed=False,
+                extra_lines=("Error: Scenario execution failed",),
+                error_message=f"Scenario execution failed: {output}",
+            )
 
-        return ScenarioResult(
-            name=config.name,
-            description=config.description,
+        # No validation script - just check scenario ran
+        if not validate_script.exists():
+            return finalize(
+                "PASSED (no validation)",
+                passed=True,
+                validation_output="No validation script found",
+            )
+
+        # Run validation
+        emit("--- Validation ---")
+        flush()
+        # The validator's report is part of the result (e.g. for --format
+        # json), so it is read back from the log even on success
+        success, validation_output = await run_script(
+            validate_script, 60, script_log_fd, collect_output=True
+        )
+        if script_log_fd is None:
+            get_console().print(f"[bold]Validation output: {config.name}[/bold]")
+            get_console().print(validation_output)
+            emit(validation_output)
+        emit("")
+
+        return finalize(
+            "PASSED" if success else "FAILED",
             passed=success,
-            duration_seconds=duration,
             validation_output=validation_output,
-            tags=config.tags,
-        )
-    else:
-        # No validation script - just check scenario ran
-        duration = time.time() - start_time
-        full_output.append("Status: PASSED (no validation)")
-        full_output.append(f"Duration: {duration:.1f}s")
-
-        # Save output file
-        output_file = scenario_dir / "latest-run.txt"
-        output_file.write_text("\n".join(full_output))
-
-        return ScenarioResult(
-            name=config.name,
-            description=config.description,
-            passed=True,
-            duration_seconds=duration,
-            validation_output="No validation script found",
-            tags=config.tags,
         )
+    finally:
+        flush()
+        os.close(log_fd)
 
 
 def print_results_table(results: list[ScenarioResult]):
     """Print results in a nice table."""
+    from rich.console import Group
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Evaluation Results")
     table.add_column("Scenario", style="cyan")
     table.add_column("Status", justify="center")
@@ -236,34 +392,84 @@ def print_results_table(results: list[ScenarioResult]):
             result.description,
         )
 
-    console.print(table)
-
     # Summary
     passed = sum(1 for r in results if r.passed)
     total = len(results)
 
-    console.print()
+    renderables = [table, Text()]
     if passed == total:
-        console.print(f"[bold green]✅ All {total} scenario(s) passed![/bold green]")
+        renderables.append(Text(f"✅ All {total} scenario(s) passed!", style="bold green"))
     else:
-        console.print(f"[bold red]❌ {total - passed} of {total} scenario(s) failed[/bold red]")
-        console.print()
-        console.print("[bold]Failed scenarios:[/bold]")
+        renderables.append(Text(f"❌ {total - passed} of {total} scenario(s) failed", style="bold red"))
+        renderables.append(Text())
+
+        # Script output is appended as plain text so stray brackets are not
+        # interpreted as Rich markup
+        failures = Text()
+        failures.append("Failed scenarios:", style="bold")
         for result in results:
             if not result.passed:
-                console.print(f"  • {result.name}: {result.error_message or 'Validation failed'}")
+                failures.append(f"\n  • {result.name}: {result.error_message or 'Validation failed'}")
                 if result.validation_output:
-                    console.print(f"    {result.validation_output}")
+                    failures.append(f"\n    {result.validation_output}")
+        renderables.append(failures)
+
+    get_console().print(Group(*renderables))
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+async def run_all(
+    scenarios: list[Path], verbose: bool = False, jobs: Optional[int] = None
+) -> list[ScenarioResult]:
+    """Run scenarios concurrently, at most jobs at a time (default: all at once).
+
+    Scenarios spend nearly all their time waiting on Claude rather than
+    computing, so they are not bounded by the number of CPUs.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    semaphore = asyncio.Semaphore(jobs if jobs is not None else len(scenarios) or 1)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=get_console(),
+        transient=True,
+    ) as progress:
+
+        async def run_one(scenario_dir: Path) -> ScenarioResult:
+            config = ScenarioConfig.from_yaml(scenario_dir / "scenario.yaml")
+
+            async with semaphore:
+                task = progress.add_task(f"Running {config.name}...", total=None)
+                try:
+                    return await run_scenario(scenario_dir, config, verbose)
+                finally:
+                    progress.remove_task(task)
+
+        return await asyncio.gather(*(run_one(d) for d in scenarios))
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Run a specific Lockplane evaluation scenario",
-        epilog="Example: %(prog)s basic-migration"
+        description="Run specific Lockplane evaluation scenarios",
+        epilog="Example: %(prog)s 00-plugin-install 01-plugin-access"
     )
     parser.add_argument(
-        "scenario",
-        help="Name of the scenario to run (e.g., 'basic-migration', 'plugin-install')",
+        "scenarios",
+        nargs="+",
+        metavar="scenario",
+        help="Names of the scenarios to run; several run concurrently (e.g., '00-plugin-install')",
     )
     parser.add_argument(
         "--format",
@@ -271,6 +477,13 @@ def main():
         default="table",
         help="Output format",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=None,
+        help="Maximum number of scenarios to run at once (default: all)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -286,27 +499,15 @@ def main():
 
     args = parser.parse_args()
 
-    # Find the specified scenario
-    scenarios = find_scenarios(args.scenarios_dir, args.scenario)
+    # Find the specified scenarios
+    scenarios = find_scenarios(args.scenarios_dir, args.scenarios)
 
-    console.print(f"Running scenario: [bold cyan]{args.scenario}[/bold cyan]")
+    names = ", ".join(path.name for path in scenarios)
+    label = "scenario" if len(scenarios) == 1 else "scenarios"
+    get_console().print(f"Running {label}: [bold cyan]{names}[/bold cyan]")
 
     # Run scenarios
-    results = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        for scenario_dir in scenarios:
-            config = ScenarioConfig.from_yaml(scenario_dir / "scenario.yaml")
-
-            task = progress.add_task(f"Running {config.name}...", total=None)
-            result = run_scenario(scenario_dir, config, args.verbose)
-            results.append(result)
-            progress.remove_task(task)
+    results = asyncio.run(run_all(scenarios, args.verbose, args.jobs))
 
     # Output results
     if args.format == "json":
@@ -0,0 +1,161 @@
+"""
+Helpers shared by the scenario and validation scripts.
+
+Each scenario.py / validate.py is a standalone uv script run from its own
+directory; they put this directory on sys.path and import from here.
+"""
+
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+
+# Test identity and initial commit, chained in one shell invocation instead of
+# one subprocess per git command
+GIT_BOOTSTRAP = (
+    "git config user.name 'Test User'"
+    " && git config user.email test@example.com"
+    " && git add README.md"
+    " && git commit -q -m 'Initial commit'"
+)
+
+# Environment passed through to Claude (see make_env)
+ENV_PASSTHROUGH = ("PATH", "TERM", "LANG", "TMPDIR", "SSL_CERT_FILE", "NODE_EXTRA_CA_CERTS")
+ENV_PASSTHROUGH_PREFIXES = ("ANTHROPIC_", "CLAUDE_", "AWS_", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY")
+# Matches the CLAUDE_ prefix but would point Claude back at the real config
+ENV_BLOCKED = frozenset(["CLAUDE_CONFIG_DIR"])
+
+
+def run_cmd(
+    cmd: list[str],
+    check: bool = True,
+    env: dict = None,
+    timeout: float = None,
+    background: bool = False,
+    **kwargs,
+):
+    """Run a command and return the result.
+
+    Commands with a timeout, or started with background=True, get their own
+    process group so that kill_cmd() takes down everything they spawned. With
+    background=True the Popen handle is returned right away; pass it to
+    wait_cmd() to collect the result.
+    """
+    cmd_str = ' '.join(str(c) for c in cmd)
+    print(f"$ {cmd_str}")
+    if timeout is None and not background:
+        return subprocess.run(cmd, capture_output=True, text=True, check=check, env=env, **kwargs)
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        process_group=0,
+        **kwargs,
+    )
+    if background:
+        return proc
+    return wait_cmd(proc, check=check, timeout=timeout)
+
+
+def kill_cmd(proc: subprocess.Popen) -> None:
+    """Kill a command started by run_cmd, along with everything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    # Like subprocess.run, reap the child without draining its pipes: a
+    # descendant that left the process group could hold them open forever
+    for pipe in (proc.stdout, proc.stderr):
+        if pipe is not None:
+            pipe.close()
+    proc.wait()
+
+
+def wait_cmd(proc: subprocess.Popen, check: bool = True, timeout: float = None) -> subprocess.CompletedProcess:
+    """Wait for a command started by run_cmd and return its result.
+
+    On timeout, or any other exception (Ctrl-C, SIGTERM), the command is
+    killed before the exception propagates.
+    """
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except BaseException:
+        kill_cmd(proc)
+        raise
+
+    result = subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+    if check:
+        result.check_returncode()
+    return result
+
+
+def exit_on_sigterm() -> None:
+    """Turn SIGTERM into SystemExit so cleanup runs before the script exits.
+
+    The eval runner stops a scenario with SIGTERM. Commands started by
+    run_cmd sit in their own process groups, so they are only killed if the
+    exception raised here unwinds through wait_cmd() / kill_cmd().
+    """
+    def handle(signum, frame):
+        sys.exit(128 + signum)
+
+    signal.signal(signal.SIGTERM, handle)
+
+
+def make_env(home: Path) -> dict[str, str]:
+    """Build the minimal environment for running Claude with an isolated HOME.
+
+    Only the passthrough variables (including API credentials and provider
+    settings, by prefix) are kept, minus anything that relocates Claude's
+    config, so the run only sees the isolated HOME.
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ENV_BLOCKED
+        and (key in ENV_PASSTHROUGH or key.upper().startswith(ENV_PASSTHROUGH_PREFIXES))
+    }
+    env.setdefault("LANG", "C.UTF-8")
+    env["HOME"] = str(home)
+    return env
+
+
+def reset_build_dir(build_dir: Path) -> None:
+    """Recreate build_dir empty without waiting for the old one to be deleted.
+
+    The previous build is renamed aside and removed on a background thread,
+    along with any trash left behind by an earlier interrupted run.
+    """
+    if build_dir.exists():
+        build_dir.rename(build_dir.with_name(f".trash-{uuid.uuid4().hex}"))
+    build_dir.mkdir(parents=True)
+
+    trash = list(build_dir.parent.glob(".trash-*"))
+    if trash:
+        def remove_trash():
+            for path in trash:
+                shutil.rmtree(path, ignore_errors=True)
+
+        threading.Thread(target=remove_trash, daemon=True).start()
+
+
+def check(name: str, condition: bool, error_msg: str = "") -> bool:
+    """Run a validation check."""
+    if condition:
+        print(f"✓ {name}")
+        return True
+    else:
+        # Build the whole report and emit it in a single write
+        report = f"✗ {name}\n"
+        if error_msg:
+            report += "".join(f"  {line}\n" for line in error_msg.split('\n'))
+        sys.stderr.write(report)
+        return False